@@ -0,0 +1,45 @@
+# Export Parquet: tipos do catálogo (_arrow_type) e conversão do CSV do COPY (_csv_to_parquet)
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app import _arrow_type, _csv_to_parquet
+
+def test_arrow_type_follows_declared_type():
+    assert _arrow_type("integer") == pa.int32()
+    assert _arrow_type("bigint") == pa.int64()
+    assert _arrow_type("numeric(3,1)") == pa.decimal128(3, 1)
+    assert _arrow_type("numeric") == pa.float64()
+    assert _arrow_type("timestamp with time zone") == pa.timestamp("us", tz="UTC")
+    with pytest.raises(TypeError):
+        _arrow_type("jsonb")
+
+RATINGS = pa.schema([
+    ("id", _arrow_type("bigint")), ("user_id", _arrow_type("integer")),
+    ("rating", _arrow_type("numeric(3,1)")), ("created_at", _arrow_type("timestamp with time zone")),
+    ("title", _arrow_type("text")),
+])
+
+def test_copy_csv_becomes_typed_parquet(tmp_path):
+    src, out = tmp_path / "r.csv.tmp", tmp_path / "r.parquet"
+    src.write_text('1,668,4.3,2018-01-01 00:28:57+00,"a, ""b"""\n'
+                   '2,,,,""\n'
+                   '3,1,0.5,2018-01-01 00:28:57.5+00,\n')
+    assert _csv_to_parquet(src, out, RATINGS) == 3
+    tbl = pq.read_table(out)
+    assert tbl.schema == RATINGS
+    assert tbl.to_pylist()[:2] == [
+        {"id": 1, "user_id": 668, "rating": Decimal("4.3"),
+         "created_at": datetime(2018, 1, 1, 0, 28, 57, tzinfo=timezone.utc), "title": 'a, "b"'},
+        {"id": 2, "user_id": None, "rating": None, "created_at": None, "title": ""},
+    ]
+    assert tbl["title"][2].as_py() is None
+
+def test_empty_result_keeps_schema(tmp_path):
+    src, out = tmp_path / "r.csv.tmp", tmp_path / "r.parquet"
+    src.write_text("")
+    assert _csv_to_parquet(src, out, RATINGS) == 0
+    assert pq.read_schema(out) == RATINGS
@@ -0,0 +1,48 @@
+# Leitura dos CSVs do lake em Arrow (_read_csv_file): tipos do staging e parse de timestamps
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pytest
+from fastapi import HTTPException
+
+from app import _read_csv_file
+
+UTC = timezone.utc
+
+def _write(tmp_path, text: str):
+    p = tmp_path / "ratings.csv"
+    p.write_text(text)
+    return p
+
+def test_v1_created_at_accepts_naive_and_offsets(tmp_path):
+    p = _write(tmp_path, "user_id,movie_id,rating,created_at\n"
+                         "1,2,4.0,2018-01-01 00:28:57\n"
+                         "1,3,3.0,2018-01-01T00:28:57Z\n"
+                         "1,4,2.0,2018-01-01 00:28:57-03:00\n"
+                         "1,5,2.0,2018-01-01 00:28:57 -03:00\n"
+                         "1,6,1.0,\n")
+    tbl = _read_csv_file(p, "ratings")
+    assert tbl.schema.field("created_at").type == pa.timestamp("us")
+    assert tbl["created_at"].to_pylist() == [
+        datetime(2018, 1, 1, 0, 28, 57), datetime(2018, 1, 1, 0, 28, 57),
+        datetime(2018, 1, 1, 3, 28, 57), datetime(2018, 1, 1, 3, 28, 57), None,
+    ]
+
+def test_v3_ts_takes_naive_values_as_utc(tmp_path):
+    p = _write(tmp_path, "uid,mid,score,ts\n"
+                         "1,2,4.0,2018-01-01 00:28:57\n"
+                         "1,3,3.0,2018-01-01 00:28:57+0530\n"
+                         "1,4,3.0,2018-02-03\n")
+    tbl = _read_csv_file(p, "ratings_v3")
+    assert tbl.schema.field("ts").type == pa.timestamp("us", tz="UTC")
+    assert tbl["ts"].to_pylist() == [
+        datetime(2018, 1, 1, 0, 28, 57, tzinfo=UTC),
+        datetime(2017, 12, 31, 18, 58, 57, tzinfo=UTC),
+        datetime(2018, 2, 3, tzinfo=UTC),
+    ]
+
+def test_invalid_timestamp_is_a_400(tmp_path):
+    p = _write(tmp_path, "user_id,movie_id,rating,created_at\n1,2,4.0,garbage\n")
+    with pytest.raises(HTTPException) as e:
+        _read_csv_file(p, "ratings")
+    assert e.value.status_code == 400
@@ -0,0 +1,61 @@
+# Split dos scripts SQL em comandos (_sql_statements) usado no pipeline mode do psycopg 3
+import pytest
+
+import app
+from app import _sql_statements
+
+def test_splits_on_semicolons_and_drops_comments():
+    sql = """
+    -- comentário; com ponto e vírgula
+    create schema if not exists x;  -- fim de linha
+    select 1
+    """
+    assert _sql_statements(sql) == ["create schema if not exists x", "select 1"]
+
+def test_keeps_semicolons_and_dashes_inside_quotes():
+    sql = "select 'a;--b' as x; select 'it''s; ok'; select 1"
+    assert _sql_statements(sql) == ["select 'a;--b' as x", "select 'it''s; ok'", "select 1"]
+
+def test_keeps_dollar_quoted_blocks_whole():
+    sql = """
+    do $$
+    declare v record;
+    begin
+      -- dentro do bloco
+      perform 1;
+    end $$;
+    select 2;
+    """
+    stmts = _sql_statements(sql)
+    assert len(stmts) == 2
+    assert stmts[0].startswith("do $$") and stmts[0].endswith("end $$")
+    assert "declare v record;" in stmts[0] and "perform 1;" in stmts[0]
+    assert stmts[1] == "select 2"
+
+def test_empty_script_has_no_statements():
+    assert _sql_statements("\n  -- só comentário\n ; ;") == []
+
+# Scripts executados via _run_script: nº de comandos esperado (muda junto com o script)
+SCRIPT_STATEMENTS = {
+    "SQL_DROP_LEGACY_MARTS": 1,
+    "SQL_CREATE_DW": 11,
+    "SQL_MIGRATE_LEGACY_RATINGS": 3,
+    "SQL_CREATE_MARTS": 9,
+    "SQL_REBUILD_MART_STATS": 2,
+    "SQL_MERGE_MART_DELTAS": 4,
+    "SQL_COMPAT_V3_TO_V1": 4,
+    "SQL_LOAD_DW_FROM_STAGING_V1V2": 8,
+    "SQL_REFRESH_MARTS": 2,
+    "SQL_ANALYZE_DW": 3,
+}
+
+@pytest.mark.parametrize("name,expected", SCRIPT_STATEMENTS.items())
+def test_pipeline_scripts_split(name, expected):
+    stmts = _sql_statements(getattr(app, name))
+    assert len(stmts) == expected
+    for st in stmts:
+        assert st and not st.startswith("--")
+        assert st.count("$$") % 2 == 0  # bloco $$ nunca cortado ao meio
+        assert st.count("'") % 2 == 0   # string nunca cortada ao meio
+    # re-split do script já dividido é estável
+    assert _sql_statements(";\n".join(stmts)) == stmts